@@ -0,0 +1,280 @@
+"""NFA to DFA subset construction and Graphviz rendering, independent of the UI."""
+from collections import defaultdict, deque
+import graphviz
+
+_WS = str.maketrans("", "", " \t")
+
+
+def _eps_closures(eps_next) -> list:
+    """
+    ε-closure bitmask of every state, given ε-successor ids per state.
+    Tarjan's SCCs finish in reverse topological order, so each component's
+    closure is its own bits OR'ed with the already finished closures of its
+    successors; every edge is visited once.
+    """
+    n = len(eps_next)
+    closure, low, order = [0] * n, [0] * n, [-1] * n
+    on_stack, stack, counter = bytearray(n), [], 0
+    for root in range(n):
+        if order[root] >= 0:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, iter(eps_next[root]))]
+        while work:
+            v, it = work[-1]
+            for w in it:
+                if order[w] < 0:
+                    order[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    work.append((w, iter(eps_next[w])))
+                    break
+                if on_stack[w]:
+                    low[v] = min(low[v], order[w])
+            else:
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    low[u] = min(low[u], low[v])
+                if low[v] == order[v]:
+                    members, mask = [], 0
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        members.append(w)
+                        mask |= 1 << w
+                        if w == v:
+                            break
+                    # Successors inside the component still have closure 0
+                    for w in members:
+                        for x in eps_next[w]:
+                            mask |= closure[x]
+                    for w in members:
+                        closure[w] = mask
+    return closure
+
+
+class NFA:
+    def __init__(self, states, alphabet, transitions, start_state, accept_states):
+        self.states = set(states)
+        self.alphabet = set(alphabet)
+        self.transitions = defaultdict(set)
+        for (s, sym), dests in transitions.items():
+            self.transitions[(s, sym)] |= set(dests)
+        self.start_state = start_state
+        self.accept_states = set(accept_states)
+        # Give every state a bit index so that subsets of states become ints
+        known = self.states | {start_state}
+        for (s, _), dests in self.transitions.items():
+            known.add(s)
+            known |= dests
+        self._names = list(known)
+        self._state_id = {q: i for i, q in enumerate(self._names)}
+        # Symbols are interned the same way; the string-keyed transitions stay for rendering
+        self._symbols = list(self.alphabet)
+        self._sym_id = {a: j for j, a in enumerate(self._symbols)}
+        eps_next = [[] for _ in self._names]
+        for (s, sym), dests in self.transitions.items():
+            if not sym:
+                eps_next[self._state_id[s]].extend(self._state_id[d] for d in dests)
+        self._eclo_mask = _eps_closures(eps_next)
+        # Outgoing transitions per state on alphabet symbols, as (symbol id, move mask, ε-closed step mask)
+        self._out = [[] for _ in self._names]
+        for (s, sym), dests in self.transitions.items():
+            j = self._sym_id.get(sym)
+            if j is not None and dests:
+                step = 0
+                for d in dests:
+                    step |= self._eclo_mask[self._state_id[d]]
+                self._out[self._state_id[s]].append((j, self._to_mask(dests), step))
+        self._accept_mask = self._to_mask(q for q in self.accept_states if q in self._state_id)
+
+    def _to_mask(self, state_set) -> int:
+        mask = 0
+        for q in state_set:
+            mask |= 1 << self._state_id[q]
+        return mask
+
+    def _from_mask(self, mask: int) -> frozenset:
+        names, found = self._names, []
+        while mask:
+            b = mask & -mask
+            found.append(names[b.bit_length() - 1])
+            mask ^= b
+        return frozenset(found)
+
+    @staticmethod
+    def parse_from_text(text):
+        """Parse NFA from text representation."""
+        states, alphabet, transitions = set(), set(), {}
+        start, accept = None, set()
+        lines = text.strip().splitlines()
+        section = None
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            key, sep, rest = line.partition(':')
+            if sep and key == 'States':
+                states = set(rest.translate(_WS).split(','))
+            elif sep and key == 'Alphabet':
+                alphabet = set(rest.translate(_WS).split(','))
+            elif sep and key == 'Start':
+                start = rest.translate(_WS)
+            elif sep and key == 'Accept':
+                accept = set(rest.translate(_WS).split(','))
+            elif sep and key == 'Transitions':
+                section = 'trans'
+            elif section == 'trans':
+                left, arrow, right = line.partition('->')
+                if not arrow or '->' in right or left.count(',') != 1:
+                    raise ValueError(f"malformed transition, expected 'state,symbol->dests': {line}")
+                s, _, sym = left.translate(_WS).partition(',')
+                dests = [x for x in right.translate(_WS).split(',') if x]
+                transitions[(s, sym)] = set(dests)
+        return NFA(states, alphabet, transitions, start, accept)
+
+
+def epsilon_closure(nfa: NFA, state_set: set) -> set:
+    stack, closure = list(state_set), set(state_set)
+    while stack:
+        s = stack.pop()
+        for nxt in nfa.transitions.get((s, ''), []):
+            if nxt not in closure:
+                closure.add(nxt)
+                stack.append(nxt)
+    return closure
+
+
+def move(nfa: NFA, state_set: set, symbol: str) -> set:
+    result = set()
+    for s in state_set:
+        result |= nfa.transitions.get((s, symbol), set()) # Union Operator
+    return result
+
+
+def _subset_construct(out, start: int, accept_mask: int, n_syms: int):
+    """
+    Subset construction on int bitmasks only.
+    - out: per NFA state, list of (symbol id, move mask, ε-closed step mask)
+    Returns: DFA states in BFS order, dict state -> [(move, next) per symbol id], accepting states
+    """
+    queue = deque([start])
+    seen, trans = {start}, {}
+    order = []
+    accepting = [start] if start & accept_mask else []
+
+    while queue:
+        curr = queue.popleft()
+        order.append(curr)
+        # Bucket the destinations by symbol, visiting only edges that exist;
+        # the step masks are already ε-closed so no separate closure pass
+        moved, stepped, m = [0] * n_syms, [0] * n_syms, curr
+        while m:
+            b = m & -m
+            for j, dests, step in out[b.bit_length() - 1]:
+                moved[j] |= dests
+                stepped[j] |= step
+            m ^= b
+        trans[curr] = list(zip(moved, stepped))
+        for nxt in stepped:
+            if nxt not in seen:
+                seen.add(nxt)
+                queue.append(nxt)
+                if nxt & accept_mask:
+                    accepting.append(nxt)
+    return order, trans, accepting
+
+
+def nfa_to_dfa(nfa: NFA):
+    alpha, symbols = nfa.alphabet.copy(), nfa._symbols
+    # DFA states are bitmasks over NFA states while exploring
+    start = nfa._eclo_mask[nfa._state_id[nfa.start_state]]
+    order, trans, accepting = _subset_construct(nfa._out, start, nfa._accept_mask, len(symbols))
+
+    # Map bitmasks back to frozensets of state names for the callers;
+    # move results repeat a lot, so each mask is decoded only once
+    sets = {m: nfa._from_mask(m) for m in order}
+    decoded = {}
+
+    def listed(mask):
+        names = decoded.get(mask)
+        if names is None:
+            names = decoded[mask] = sorted(sets[mask] if mask in sets else nfa._from_mask(mask))
+        return names
+
+    logs = []
+    for curr in order:
+        logs.append(f"Current DFA state: {listed(curr)}")
+        for sym, (mv, nxt) in zip(symbols, trans[curr]):
+            logs.append(f"  On '{sym}': move -> {listed(mv)}, ε-closure -> {listed(nxt)}")
+    dfa_states = set(sets.values())
+    dfa_trans = {(sets[c], sym): sets[n] for c, row in trans.items() for sym, (_, n) in zip(symbols, row)}
+    dfa_accept = {sets[m] for m in accepting}
+    return dfa_states, alpha, dfa_trans, sets[start], dfa_accept, logs
+
+
+
+
+_QUOTE = str.maketrans({'"': '\\"'})
+
+
+def cleanstr(s) -> str:
+    """Label for a state; a set of NFA states is listed by name, sorted."""
+    if isinstance(s, (set, frozenset)):
+        return ", ".join(sorted(map(str, s)))
+    return str(s).strip()
+
+
+def visualize_automaton(states, transitions, start_state, accept_states, title='Automaton', filename=None):
+    """
+    Render automaton using Graphviz.
+    - states: iterable of state identifiers
+    - transitions: dict (state, symbol) -> next_state(s)
+    - start_state: start identifier
+    - accept_states: iterable of accept identifiers
+    - title: graph title
+    - filename: if provided, save as DOT and PNG with this name
+    Returns: graphviz.Source object
+    """
+    def q(s: str):
+        return '"' + s.translate(_QUOTE) + '"'
+
+    font = q("Times New Roman Bold")
+    lines = [
+        f"// {title}\n",
+        "digraph {\n",
+        "\tgraph [nodesep=0.5 rankdir=LR ranksep=0.75]\n",
+        f"\tnode [fontname={font}]\n",
+        f"\tedge [fontname={font}]\n",
+    ]
+
+    # Clean each state's label once; edges reuse it
+    labels = {s: q(cleanstr(s)) for s in states}
+
+    def label_of(s):
+        return labels.get(s) or q(cleanstr(s))
+
+    # Add nodes
+    for s, label in labels.items():
+        shape = 'doublecircle' if s in accept_states else 'circle'
+        lines.append(f"\t{label} [label={label} shape={shape}]\n")
+
+    # Invisible start arrow
+    lines.append('\t_start [label="" shape=none]\n')
+    lines.append(f"\t_start -> {label_of(start_state)} [label=start]\n")
+
+    # Add transitions, merging parallel edges into one with a combined label
+    edges = defaultdict(set)
+    for (src, sym), dsts in transitions.items():
+        src_lbl = label_of(src)
+        for d in (dsts if isinstance(dsts, (set, list)) else [dsts]):
+            edges[(src_lbl, label_of(d))].add(sym or 'ε')
+    for (src_lbl, dst_lbl), syms in edges.items():
+        lines.append(f"\t{src_lbl} -> {dst_lbl} [label={q(','.join(sorted(syms)))}]\n")
+    lines.append("}\n")
+    return graphviz.Source(''.join(lines), format='svg')
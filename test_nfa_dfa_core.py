@@ -0,0 +1,129 @@
+from pathlib import Path
+
+import pytest
+
+from nfa_dfa_core import NFA, cleanstr, nfa_to_dfa, visualize_automaton
+
+HERE = Path(__file__).parent
+
+
+def convert(name):
+    nfa = NFA.parse_from_text((HERE / name).read_text(encoding='utf-8'))
+    return nfa_to_dfa(nfa)
+
+
+def fs(*states):
+    return frozenset(states)
+
+
+def test_example1():
+    states, alpha, trans, start, accept, logs = convert('example1.txt')
+    q0, q01, q02 = fs('q0'), fs('q0', 'q1'), fs('q0', 'q2')
+    assert states == {q0, q01, q02}
+    assert alpha == {'a', 'b'}
+    assert start == q0
+    assert accept == {q02}
+    assert trans == {
+        (q0, 'a'): q01, (q0, 'b'): q0,
+        (q01, 'a'): q01, (q01, 'b'): q02,
+        (q02, 'a'): q01, (q02, 'b'): q0,
+    }
+    assert len(logs) == 3 * 3
+
+
+def test_example2():
+    states, _, trans, start, accept, _ = convert('example2.txt')
+    q0, q01, q012 = fs('q0'), fs('q0', 'q1'), fs('q0', 'q1', 'q2')
+    q013, q0123 = fs('q0', 'q1', 'q3'), fs('q0', 'q1', 'q2', 'q3')
+    assert states == {q0, q01, q012, q013, q0123}
+    assert start == q0
+    assert accept == {q013, q0123}
+    assert trans[(q012, '0')] == q0123
+    assert trans[(q012, '1')] == q013
+    assert trans[(q013, '0')] == q012
+
+
+def test_example3_epsilon():
+    states, _, trans, start, accept, _ = convert('example3.txt')
+    a = fs('0', '1', '2', '4', '7')
+    b = fs('1', '2', '3', '4', '6', '7', '8')
+    c = fs('1', '2', '4', '5', '6', '7')
+    d = fs('1', '2', '4', '5', '6', '7', '9')
+    e = fs('1', '2', '4', '5', '6', '7', '10')
+    assert states == {a, b, c, d, e}
+    assert start == a
+    assert accept == {e}
+    assert [trans[(s, 'b')] for s in (a, b, d, e)] == [c, d, e, c]
+
+
+def test_dead_state():
+    nfa = NFA.parse_from_text("""
+States: p,q
+Alphabet: a,b
+Start: p
+Accept: q
+Transitions:
+p,a->q
+""")
+    states, _, trans, _, accept, _ = nfa_to_dfa(nfa)
+    assert states == {fs('p'), fs('q'), fs()}
+    assert trans[(fs('p'), 'b')] == fs()
+    assert trans[(fs(), 'a')] == fs()
+    assert accept == {fs('q')}
+
+
+@pytest.mark.parametrize('line', [
+    'q0->q1',
+    'q0 a->q1',
+    'q0,a,b->q1',
+    'q0,a->q1->q0',
+    'q0,a q1',
+])
+def test_malformed_transition(line):
+    with pytest.raises(ValueError):
+        NFA.parse_from_text(f"States: q0,q1\nTransitions:\n{line}")
+
+
+def test_parse_spaces():
+    nfa = NFA.parse_from_text("States: q0, q1\nStart: q0\nTransitions:\nq0, a -> q0, q1\nq1, -> q0")
+    assert nfa.states == {'q0', 'q1'}
+    assert nfa.transitions == {('q0', 'a'): {'q0', 'q1'}, ('q1', ''): {'q0'}}
+
+
+def test_headers_need_colon():
+    nfa = NFA.parse_from_text("States: q0,q1\nStart: q0\nStart\nTransitions\nAccept: q1")
+    assert nfa.start_state == 'q0'
+    assert nfa.accept_states == {'q1'}
+    assert nfa.transitions == {}
+
+
+def test_cleanstr():
+    assert cleanstr('s0') == 's0'
+    assert cleanstr(fs('q1')) == 'q1'
+    assert cleanstr(fs()) == ''
+    assert cleanstr(fs('q2', 'q10', 'q1')) == 'q1, q10, q2'
+    assert cleanstr("it's") == "it's"
+
+
+def test_visualize_merges_parallel_edges():
+    transitions = {('p', 'a'): {'q'}, ('p', 'b'): {'q'}, ('p', ''): {'q', 'p'}}
+    src = visualize_automaton({'p', 'q'}, transitions, 'p', {'q'}).source
+    assert src.count('"p" -> "q"') == 1
+    assert '"p" -> "q" [label="a,b,ε"]' in src
+    assert '"p" -> "p" [label="ε"]' in src
+
+
+def test_visualize_dfa_edges():
+    states, _, trans, start, accept, _ = convert('example1.txt')
+    src = visualize_automaton(states, trans, start, accept).source
+    assert '"q0, q1" [label="q0, q1" shape=circle]' in src
+    assert '"q0, q2" [label="q0, q2" shape=doublecircle]' in src
+    assert '"q0" [label="q0" shape=circle]' in src
+    assert '_start -> "q0" [label=start]' in src
+    assert src.count(' -> ') == 1 + len(trans)
+
+
+def test_visualize_escapes_quotes():
+    src = visualize_automaton({'say "hi"'}, {('say "hi"', 'a'): {'say "hi"'}}, 'say "hi"', set()).source
+    assert '"say \\"hi\\"" [label="say \\"hi\\"" shape=circle]' in src
+    assert '"say \\"hi\\"" -> "say \\"hi\\"" [label="a"]' in src